@@ -4,27 +4,56 @@ Classes:
     AttrPath: A class for handling attribute paths.
 
 Functions:
+    path_getter: Get a C-level getter for a tuple of path parts.
     getattr_path: Get an attribute path.
+    getattr_path_parsed: Get an attribute path that is already split into parts.
     setattr_path: Set an attribute path.
 
 Exceptions:
     UnknownValueError: An exception for unknown values.
 """
 
-from collections import deque
-from collections.abc import Generator
-from typing import Any, SupportsIndex, TypeVar, cast
-
-from pydantic import BaseModel, model_validator
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache, partial, reduce
+from operator import attrgetter
+from typing import SupportsIndex, TypeVar, cast
 
 from attrmagic.operators import Operators
 
 from .sentinels import MISSING, Missing
-from .utils import override, path_as_parts
+from .utils import override, split_path
 
 _T = TypeVar("_T")
 
 
+@lru_cache(maxsize=1024)
+def path_getter(parts: tuple[str, ...]) -> Callable[[object], object]:
+    """Get a callable that follows `parts` from an object, looping in C.
+
+    Example:
+    ```
+    >>> foo = Foo(a=Bar(b=Baz(c=42)))
+    >>> path_getter(("a", "b", "c"))(foo)
+    42
+    ```
+
+    Args:
+        parts: The attribute names to follow, in order.
+
+    Returns:
+        An `operator.attrgetter` for the dotted path, or `reduce(getattr, ...)` when a
+        part is empty or contains a dot.
+
+    Raises:
+        AttributeError: When called, if an attribute is missing or an intermediate
+            attribute is `None`.
+    """
+    if parts and all(part and "." not in part for part in parts):
+        return attrgetter(".".join(parts))
+    return partial(reduce, getattr, parts)
+
+
 def getattr_path(
     obj: object,
     path: "str | AttrPath",
@@ -56,25 +85,107 @@ def getattr_path(
     """
     if path == "":
         return obj
+    if isinstance(path, str) and separator not in path:
+        return _getattr_single(obj, path, default)
+    attr_path = (
+        path
+        if type(path) is AttrPath
+        else AttrPath.str_to_path(path, separator=separator)
+    )
+    if default is MISSING:
+        return _walk_raise(obj, attr_path.parts, path)
+    return _walk_default(obj, attr_path.parts, default)
+
+
+def getattr_path_parsed(
+    obj: object,
+    attrs: tuple[str, ...],
+    *,
+    separator: str = "__",
+    default: _T | Missing = MISSING,
+) -> object | _T:
+    """Get an attribute path that has already been split into its parts.
+
+    Use this over `getattr_path` when following the same path across many objects,
+    so the path string isn't parsed for every object.
+
+    Example:
+    ```
+    >>> foo = Foo(a=Bar(b=Baz(c=42)))
+    >>> getattr_path_parsed(foo, ("a", "b", "c"))
+    42
+    ```
+
+    Args:
+        obj: The object to get the attribute from.
+        attrs: The attribute names to follow, in order.
+        separator: The separator to show the path with in error messages.
+        default: The default value to return if the attribute is not found.
+
+    Returns:
+        The attribute at the given path.
+
+    Raises:
+        AttributeError: If the attribute does not exist, including any intermediate attributes.
+    """
+    if default is MISSING:
+        return _walk_raise(obj, attrs, attrs, separator=separator)
+    return _walk_default(obj, attrs, default)
+
+
+def _walk_raise(
+    obj: object,
+    parts: tuple[str, ...],
+    path: "str | AttrPath | tuple[str, ...]",
+    *,
+    separator: str = "__",
+) -> object:
+    """Follow `parts` from `obj`, raising a descriptive error for a missing attribute."""
+    try:
+        return path_getter(parts)(obj)
+    except AttributeError:
+        pass  # walk step by step to tell a `None` along the path from a missing attribute
     current = obj
-    attr_path = AttrPath.str_to_path(path, separator=separator)
-    for name in attr_path:
-        if default is MISSING:
-            try:
-                current = getattr(current, name)  # pyright: ignore[reportAny]
-            except AttributeError as e:
-                msg = f"'{type(obj).__name__}' object has no attribute path '{path}', since {e}"
-                raise AttributeError(msg) from e
-
-        else:
-            current = getattr(current, name, MISSING)
-            if current is MISSING:
-                return default
+    for name in parts:
+        try:
+            current = getattr(current, name)  # pyright: ignore[reportAny]
+        except AttributeError as e:
+            if isinstance(path, tuple):
+                path = separator.join(path)
+            msg = f"'{type(obj).__name__}' object has no attribute path '{path}', since {e}"
+            raise AttributeError(msg) from e
         if current is None:
             return None
     return current
 
 
+def _walk_default(obj: object, parts: tuple[str, ...], default: _T) -> object | _T:
+    """Follow `parts` from `obj`, returning `default` for a missing attribute."""
+    try:
+        return path_getter(parts)(obj)
+    except AttributeError:
+        pass  # walk step by step to tell a `None` along the path from a missing attribute
+    current = obj
+    for name in parts:
+        current = getattr(current, name, MISSING)
+        if current is MISSING:
+            return default
+        if current is None:
+            return None
+    return current
+
+
+def _getattr_single(obj: object, name: str, default: _T | Missing) -> object | _T:
+    """Single attribute lookup for `getattr_path`, skipping AttrPath entirely."""
+    if default is not MISSING:
+        return getattr(obj, name, default)
+    try:
+        return getattr(obj, name)
+    except AttributeError as e:
+        msg = f"'{type(obj).__name__}' object has no attribute path '{name}', since {e}"
+        raise AttributeError(msg) from e
+
+
 def setattr_path(
     obj: object, path: str, value: object, *, separator: str = "__"
 ) -> None:
@@ -94,22 +205,27 @@ def setattr_path(
         value: The value to set the attribute to.
         separator: The separator to use.
     """
+    if separator not in path:
+        setattr(obj, path, value)
+        return
     current = obj
-    parts = path_as_parts(path, separator=separator)
-    for name in list(parts)[:-1]:
+    parts = split_path(path, separator)
+    for name in parts[:-1]:
         current = getattr(current, name)  # pyright: ignore[reportAny]
     setattr(current, parts[-1], value)
 
 
-class AttrPath(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AttrPath:
     """Represents a path-like structure using a string with a specified separator.
 
     Attributes:
-        value (str): The string representation of the path.
+        value (str): The string representation of the path. A sequence of parts is
+            joined using the separator.
 
     Methods:
         str_to_path(cls, value: "str | AttrPath") -> "AttrPath": Converts a string or AttrPath instance to an AttrPath instance.
-        parts(): Returns the deque of parts.
+        parts(): Returns the parts of the path.
         pop(index: int = -1): Removes and returns the part at the specified index.
         popleft(): Removes and returns the leftmost part.
         get(index: int): Returns the part at the specified index.
@@ -119,33 +235,13 @@ class AttrPath(BaseModel):
 
     separator: str = "__"
     value: str
-    _parts: deque[str] | None = None
+    _parts: tuple[str, ...] = field(init=False, repr=False, compare=False)
 
-    @model_validator(mode="before")
-    @classmethod
-    def value_as_string(cls, data: Any) -> Any:  # pyright: ignore[reportAny, reportExplicitAny]
-        """Converts a sequence of values into a path string."""
-        if isinstance(data, dict):
-            if isinstance(data["value"], str):
-                return data  # pyright: ignore[reportUnknownVariableType]
-
-            separator = cast(
-                "str",
-                (
-                    data["separator"]
-                    if "separator" in data
-                    else cls.get_field_default("separator")
-                ),
-            )
-            data["value"] = separator.join(data["value"])  # pyright: ignore[reportUnknownArgumentType]
-        return data  # pyright: ignore[reportUnknownVariableType]
-
-    @classmethod
-    def get_field_default(cls, field_name: str) -> Any:  # pyright: ignore[reportAny, reportExplicitAny]
-        """Returns the default value for the specified field."""
-        fields = cls.model_fields
-        field = next(fields[name] for name in fields if name == field_name)
-        return field.default  # pyright: ignore[reportAny]
+    def __post_init__(self) -> None:
+        """Converts a sequence of values into a path string and splits it into parts."""
+        if not isinstance(self.value, str):
+            self.value = self.separator.join(cast("Iterable[str]", self.value))
+        self._parts = split_path(self.value, self.separator)
 
     @classmethod
     def str_to_path(
@@ -164,37 +260,36 @@ class AttrPath(BaseModel):
             return cls(value=value, separator=separator)
         return value
 
-    @override
-    def __iter__(self) -> Generator[str, Any, None]:  # pyright: ignore[reportExplicitAny, reportIncompatibleMethodOverride]
+    def __iter__(self) -> Iterator[str]:
         """Returns an iterator over the parts of the path."""
-        yield from iter(self.parts)
+        return iter(self._parts)
 
     def __getitem__(self, index: SupportsIndex):
         """Returns the part at the specified index."""
         return self.parts[index]
 
     @property
-    def parts(self) -> deque[str]:
+    def parts(self) -> tuple[str, ...]:
         """Returns the parts attribute.
 
         Returns:
-            list: The parts attribute.
+            tuple: The parts attribute.
         """
-        if self._parts is None:
-            self._parts = path_as_parts(self.value, separator=self.separator)
         return self._parts
 
     def pop(self, index: int = -1) -> str:
         """Removes and returns the part at the specified index."""
         parts = self.parts
-        parts.rotate(-index)
-        value = parts.popleft()
-        parts.rotate(index)
+        value = parts[index]
+        index %= len(parts)
+        self._parts = parts[:index] + parts[index + 1 :]
         return value
 
     def popleft(self) -> str:
         """Removes and returns the leftmost part."""
-        return self.parts.popleft()
+        parts = self.parts
+        self._parts = parts[1:]
+        return parts[0]
 
     def render(self):
         """Joins the parts into a string using the separator and returns it."""
@@ -210,7 +305,8 @@ class AttrPath(BaseModel):
         return len(self.parts)
 
 
-class QueryPath(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class QueryPath:
     """Represents a query path."""
 
     attr_path: AttrPath
@@ -228,18 +324,74 @@ class QueryPath(BaseModel):
         Returns:
             A QueryPath instance.
         """
-        parts = list(path_as_parts(value, separator=separator))
-
-        operator_candidate = parts[-1].upper()
-        if operator_candidate not in Operators.__members__:
-            path = separator.join(parts)
-            return cls(
-                attr_path=AttrPath(value=path, separator=separator),
-                _separator=separator,
-            )
-        path = separator.join(parts[:-1])
+        path, operator = _parse_query_path(value, separator)
         return cls(
             attr_path=AttrPath(value=path, separator=separator),
-            operator=Operators[operator_candidate],
+            operator=operator,
             _separator=separator,
         )
+
+    @property
+    def parts(self) -> tuple[str, ...]:
+        """Get the attribute path parts, empty when the query targets the object itself."""
+        return self.attr_path.parts if self.attr_path.value else ()
+
+    def compile(self, rhs: object) -> Callable[[object], bool]:
+        """Build a predicate over objects for this query against `rhs`.
+
+        Example:
+        ```
+        >>> matches = QueryPath.from_string("a__b__startswith").compile("he")
+        >>> matches(Foo(a=Bar(b="hello")))
+        True
+        ```
+
+        Args:
+            rhs: The value to compare against.
+
+        Returns:
+            A callable taking the object to evaluate the query on.
+
+        Raises:
+            TypeError: If the operator can't be used with `rhs`.
+        """
+        self.operator.validate_rhs(rhs)
+        return self.follow(self.operator.bind(rhs))
+
+    def follow(self, matches: Callable[[object], bool]) -> Callable[[object], bool]:
+        """Turn a predicate over values into one over objects, via this query's path.
+
+        The attribute getter is resolved once, so the predicate can be applied to many
+        objects cheaply. An empty path compares the object itself; a `None` along the
+        path is compared as-is, matching `getattr_path`.
+
+        Args:
+            matches: The predicate over the value at the end of the path, e.g. from
+                `Operators.bind`.
+
+        Returns:
+            A callable taking the object to evaluate the query on.
+        """
+        parts = self.parts
+        separator = self._separator
+        getter = path_getter(parts)
+
+        def predicate(obj: object) -> bool:
+            try:
+                current = getter(obj)
+            except AttributeError:
+                current = getattr_path_parsed(obj, parts, separator=separator)
+            return matches(current)
+
+        return predicate
+
+
+@lru_cache(maxsize=1024)
+def _parse_query_path(value: str, separator: str) -> tuple[str, Operators]:
+    """Split a query string into its attribute path and operator."""
+    parts = split_path(value, separator)
+
+    operator = Operators.resolve(parts[-1])
+    if operator is None:
+        return value, Operators.EXACT
+    return separator.join(parts[:-1]), operator
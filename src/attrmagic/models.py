@@ -5,9 +5,10 @@ Classes:
     SearchBase: A generic root model for searching and filtering lists of ClassBase objects.
 """
 
-from collections.abc import Hashable, Iterable, Iterator, Mapping
-from decimal import Decimal
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
 from functools import cached_property
+from itertools import compress
+from operator import not_
 from typing import (
     TYPE_CHECKING,
     Generic,
@@ -22,7 +23,7 @@ from typing import (
 from pydantic import BaseModel, RootModel
 from pydantic_core.core_schema import ListSchema, ModelSchema
 
-from attrmagic.core import AttrPath, QueryPath, getattr_path
+from attrmagic.core import AttrPath, QueryPath, getattr_path, path_getter
 from attrmagic.operators import Operators
 from attrmagic.sentinels import MISSING, Missing
 from attrmagic.utils import override
@@ -83,34 +84,78 @@ class Filter(BaseModel, Generic[SimpleBase]):
     path: QueryPath
     value: object
 
-    @cached_property
+    @property
     def attr_path(self) -> AttrPath:
         """Get the attribute path."""
         return self.path.attr_path
 
-    @cached_property
+    @property
     def operator(self) -> Operators:
         """Get the operator."""
         return self.path.operator
 
     @classmethod
     def from_kwarg(cls, **kwargs: object) -> list[Self]:
-        """Create a filter from a kwarg."""
+        """Create a filter from a kwarg.
 
-        def qp(path: str) -> QueryPath:
-            return QueryPath.from_string(path)
+        Validation is skipped: the path is parsed into a `QueryPath` here and the value
+        accepts any object, so there is nothing left for pydantic to check. The value
+        is checked against the operator once here rather than on every comparison.
 
-        return [cls(path=qp(path), value=value) for path, value in kwargs.items()]
+        Raises:
+            TypeError: If the value can't be used with the operator.
+        """
+        filters: list[Self] = []
+        for path, value in kwargs.items():
+            query_path = QueryPath.from_string(path)
+            query_path.operator.validate_rhs(value)
+            filters.append(cls.model_construct(path=query_path, value=value))
+        return filters
+
+    @cached_property
+    def _matches(self) -> Callable[[object], bool]:
+        """Get the operator bound to the filter value, as a predicate over values."""
+        return self.operator.bind(self.value)
+
+    @cached_property
+    def _compiled(self) -> Callable[[SimpleBase], bool]:
+        """Get the compiled query, as a predicate over items."""
+        return self.path.follow(self._matches)
 
     def evaluate(self, item: SimpleBase) -> bool:
         """Evaluate the filter against an item."""
-        value = cast("Decimal | float | str", getattr_path(item, self.attr_path))
-        return self.operator.evaluate(value, self.value)  # pyright: ignore[reportArgumentType]
+        return self._compiled(item)
+
+    def _mask(self, items: list[SimpleBase]) -> Iterator[bool]:
+        """Evaluate the filter against a list of items, column-wise.
+
+        The attribute column is pulled out and compared with C-level `map` calls;
+        if any item has a `None` along the path, fall back to the per-item predicate.
+        """
+        try:
+            column = list(map(path_getter(self.path.parts), items))
+        except AttributeError:
+            return map(self._compiled, items)
+        return map(self._matches, column)
 
 
 SearchRoot = TypeVar("SearchRoot", bound=ClassBase)
 
 
+def _match_all(predicates: list[Callable[[_T], bool]]) -> Callable[[_T], bool]:
+    """Combine predicates into one that stops at the first failing predicate."""
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def match(item: _T) -> bool:
+        for predicate in predicates:
+            if not predicate(item):
+                return False
+        return True
+
+    return match
+
+
 def _get_or_raise(obj: Mapping[str, _T], attr: str) -> _T:
     result = obj[attr]
     if result is None:
@@ -156,10 +201,14 @@ class SimpleListRoot(RootModel[list[SimpleBase]], Generic[SimpleBase]):  # noqa:
 
     def _filter_list(self, filters: Iterable[Filter[SimpleBase]]) -> Self:
         assert isinstance(self.root, list), "_filter_list requires that root is a list"
-        for filter in filters:
-            self.root: list[SimpleBase] = [
-                item for item in self.root if filter.evaluate(item)
-            ]
+        filters = list(filters)
+        if len(filters) == 1:
+            self.root: list[SimpleBase] = list(
+                compress(self.root, filters[0]._mask(self.root))
+            )
+        else:
+            match = _match_all([filter._compiled for filter in filters])
+            self.root = [item for item in self.root if match(item)]
         return self
 
     @property
@@ -190,6 +239,27 @@ class SimpleListRoot(RootModel[list[SimpleBase]], Generic[SimpleBase]):  # noqa:
         assert isinstance(self.root, list), "root must be a list"
         return self._filter_list(filters)
 
+    def filter_many(self, *filter_kwargs: Mapping[str, object]) -> Self:
+        """Find items that match every set of kwargs, in a single pass.
+
+        Equivalent to chaining `filter` calls, but the list is only walked once.
+
+        Example:
+        ```
+        >>> search = SimpleRoot[list[Foo]](root=[Foo(a=1), Foo(a=2), Foo(a=3)])
+        >>> search.filter_many({"a__gt": 1}, {"a__lt": 3})
+        SearchRoot([Foo(a=2)])
+        ```
+
+        Args:
+            filter_kwargs: The attributes to filter by, as one mapping per `filter` call.
+        """
+        filters = [
+            filter for kwargs in filter_kwargs for filter in self._get_filters(**kwargs)
+        ]
+        assert isinstance(self.root, list), "root must be a list"
+        return self._filter_list(filters)
+
     @overload
     def get(
         self, *, default: SimpleBase | Missing = MISSING, **kwargs: object
@@ -207,11 +277,17 @@ class SimpleListRoot(RootModel[list[SimpleBase]], Generic[SimpleBase]):  # noqa:
         Raises:
             ValueError: If 0 or more than 1 items are returned.
         """
-        items_list = self.model_copy().filter(**kwargs)
-
-        if (list_len := len(items_list)) != 1:
+        match = _match_all([filter._compiled for filter in self._get_filters(**kwargs)])
+        found: list[SimpleBase] = []
+        for item in self.root:
+            if match(item):
+                found.append(item)
+                if len(found) > 1:
+                    break
+
+        if (found_len := len(found)) != 1:
             if default is MISSING:
-                match list_len:
+                match found_len:
                     case 0:
                         msg = "get() returned no items"
                     case _:
@@ -219,7 +295,7 @@ class SimpleListRoot(RootModel[list[SimpleBase]], Generic[SimpleBase]):  # noqa:
                 raise ValueError(msg)
             return default
 
-        return items_list[0]
+        return found[0]
 
     def append(self, item: SimpleBase):
         """Append an item to the end of class."""
@@ -228,11 +304,14 @@ class SimpleListRoot(RootModel[list[SimpleBase]], Generic[SimpleBase]):  # noqa:
     def __add__(  # noqa: D105
         self, other: "SimpleListRoot[SimpleBase] | Iterable[SimpleBase]"
     ) -> Self:
-        match other:
-            case SimpleListRoot():
-                self.root += other.root
-            case Iterable():
-                self.root += list(other)
+        if isinstance(other, SimpleListRoot):
+            self.root += other.root
+        elif hasattr(other, "__iter__"):
+            self.root.extend(other)
+        else:
+            raise NotImplementedError(
+                f"Invalid type for __add__: other={type(other)}"  # pyright: ignore[reportUnknownArgumentType]
+            )
 
         return self
 
@@ -352,32 +431,13 @@ class SearchBase(SimpleListRoot[SearchRoot], Generic[SearchRoot]):
     ```
     """
 
-    def _compare(
-        self, item: SearchRoot, lhs: str | AttrPath, rhs: object, operator: Operators
-    ) -> bool:
-        value = item.getattr_path(attr_path=lhs)
-        return operator.evaluate(value, rhs)  # pyright: ignore[reportArgumentType]
-
-    def _split_kwarg(self, **kwargs: _T) -> tuple[str, _T]:
-        """Return tuple of lhs and rhs."""
-        assert len(kwargs) <= 1, "only one kwarg is allowed beyond default"
-
-        return next(iter(kwargs.items()))
-
-    def _get_compare_tuple(self, **kwargs: _T) -> tuple[AttrPath, _T, Operators]:
-        """Return tuple of lhs, rhs, and operator."""
-        lhs, rhs = self._split_kwarg(**kwargs)
-        query_path = QueryPath.from_string(lhs)
-        lhs, operator = query_path.attr_path, query_path.operator
-
-        return lhs, rhs, operator
-
     def exclude(self, **kwargs: object) -> Self:
         """Remove items that match the kwargs."""
-        lhs, rhs, operator = self._get_compare_tuple(**kwargs)
+        assert len(kwargs) <= 1, "only one kwarg is allowed beyond default"
+        (excluded,) = self._get_filters(**kwargs)
 
-        self.root: list[SearchRoot] = [
-            item for item in self.root if not self._compare(item, lhs, rhs, operator)
-        ]
+        self.root: list[SearchRoot] = list(
+            compress(self.root, map(not_, excluded._mask(self.root)))
+        )
 
         return self
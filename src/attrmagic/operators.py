@@ -23,16 +23,15 @@ Functions:
     range: Check if value is within a range.
 """
 
+import operator
 from collections.abc import Callable, Iterable
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum, member
-from typing import TYPE_CHECKING, TypeVar, override
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar, cast, override
 
-# from .utils import validate_call_lex
-from pydantic import validate_call
-
-from attrmagic.utils import validate_call_lex
+from attrmagic.utils import NUMERIC_TYPES, decimal_or_string, validate_call_lex
 
 _T = TypeVar("_T", Decimal, float, str)
 
@@ -132,7 +131,6 @@ def less_than_or_equal_to(value: _T, rhs: _T):
     return value <= rhs
 
 
-# @validate_call
 def in_(value: _T, rhs: "Iterable[_T]") -> bool:
     """Check if value is in rhs.
 
@@ -152,7 +150,6 @@ def in_(value: _T, rhs: "Iterable[_T]") -> bool:
 
 
 # TODO: should this accept more types?
-@validate_call
 def contains(value: str, rhs: str) -> bool:
     """Check if value contains rhs.
 
@@ -171,7 +168,6 @@ def contains(value: str, rhs: str) -> bool:
     return rhs in value
 
 
-@validate_call
 def icontains(value: str, rhs: str) -> bool:
     """Check if value contains rhs, case-insensitive.
 
@@ -192,7 +188,6 @@ def icontains(value: str, rhs: str) -> bool:
     return rhs.lower() in value.lower()
 
 
-@validate_call
 def startswith(value: str, rhs: str) -> bool:
     """Check if value starts with rhs.
 
@@ -211,7 +206,6 @@ def startswith(value: str, rhs: str) -> bool:
     return value.startswith(rhs)
 
 
-@validate_call
 def istartswith(value: str, rhs: str) -> bool:
     """Check if value starts with rhs, case-insensitive.
 
@@ -232,7 +226,6 @@ def istartswith(value: str, rhs: str) -> bool:
     return value.lower().startswith(rhs.lower())
 
 
-@validate_call
 def endswith(value: str, rhs: str) -> bool:
     """Check if value ends with rhs.
 
@@ -255,7 +248,6 @@ def endswith(value: str, rhs: str) -> bool:
     return value.endswith(rhs)
 
 
-@validate_call
 def iendswith(value: str, rhs: str):
     """Check if value ends with rhs, case-insensitive.
 
@@ -278,7 +270,6 @@ def iendswith(value: str, rhs: str):
     return value.lower().endswith(rhs.lower())
 
 
-@validate_call
 def iequal(value: str, rhs: str):
     """Check if value is equal to rhs, case-insensitive.
 
@@ -304,7 +295,6 @@ def iequal(value: str, rhs: str):
 R = TypeVar("R", datetime, Decimal, float, int, str)
 
 
-@validate_call
 def range(value: R, rhs: tuple[R, R]) -> bool:
     """Check if value is within a range.
 
@@ -323,6 +313,103 @@ def range(value: R, rhs: tuple[R, R]) -> bool:
     return rhs[0] <= value <= rhs[1]
 
 
+def _between(lower: R, upper: R, value: R) -> bool:
+    return lower <= value <= upper
+
+
+def _compare_lex(
+    compare: Callable[[object, object], bool], rhs_lex: object, value: object
+) -> bool:
+    return compare(decimal_or_string(value), rhs_lex)  # pyright: ignore[reportArgumentType]
+
+
+def _compare_numeric(
+    compare: Callable[[object, object], bool],
+    rhs: object,
+    rhs_lex: object,
+    value: object,
+) -> bool:
+    if type(value) is type(rhs):
+        return compare(value, rhs)
+    return compare(decimal_or_string(value), rhs_lex)  # pyright: ignore[reportArgumentType]
+
+
+# A needle longer than the value can't match; rejecting on length skips the method call.
+# Only for case-sensitive operators, since `lower()` can change a string's length.
+def _contains_checked(rhs: str, value: str) -> bool:
+    return len(rhs) <= len(value) and rhs in value
+
+
+def _startswith_checked(rhs: str, value: str) -> bool:
+    return len(rhs) <= len(value) and value.startswith(rhs)
+
+
+def _endswith_checked(rhs: str, value: str) -> bool:
+    return len(rhs) <= len(value) and value.endswith(rhs)
+
+
+# Single-character needles compare a one-character slice instead of calling the method
+def _startswith_char(rhs: str, value: str) -> bool:
+    return value[:1] == rhs
+
+
+def _endswith_char(rhs: str, value: str) -> bool:
+    return value[-1:] == rhs
+
+
+def _require_str(value: object) -> str:
+    """Reject non-str values up front, for every string operator alike."""
+    if not isinstance(value, str):
+        msg = f"String operators require a str to compare, got {type(value).__name__}"
+        raise TypeError(msg)
+    return value
+
+
+def _match_str(match: Callable[[str, str], bool], rhs: str, value: object) -> bool:
+    return match(rhs, _require_str(value))
+
+
+def _in_set(rhs_set: frozenset[object], rhs: "Iterable[object]", value: object) -> bool:
+    try:
+        return value in rhs_set
+    except TypeError:  # unhashable value, e.g. a list
+        return value in rhs
+
+
+def _bind_in_set(rhs: object) -> Callable[[object], bool] | None:
+    """Bind `IN` to a set of its candidates, or `None` to keep the linear scan."""
+    if isinstance(rhs, str | bytes):  # substring semantics
+        return None
+    try:
+        rhs_set = frozenset(cast("Iterable[object]", rhs))
+    except TypeError:  # unhashable candidates
+        return None
+    return partial(_in_set, rhs_set, cast("Iterable[object]", rhs))
+
+
+def _iequal_lowered(rhs_lower: str, value: str) -> bool:
+    return value.lower() == rhs_lower
+
+
+def _icontains_lowered(rhs_lower: str, value: str) -> bool:
+    return rhs_lower in value.lower()
+
+
+# For ASCII values only the anchored slice is lowered; other scripts have to be lowered
+# whole, since `lower()` can change length or depend on context (e.g. final sigma).
+def _istartswith_lowered(rhs_lower: str, value: str) -> bool:
+    if value.isascii():
+        return value[: len(rhs_lower)].lower() == rhs_lower
+    return value.lower().startswith(rhs_lower)
+
+
+def _iendswith_lowered(rhs_lower: str, value: str) -> bool:
+    if value.isascii():
+        start = len(value) - len(rhs_lower)
+        return start >= 0 and value[start:].lower() == rhs_lower
+    return value.lower().endswith(rhs_lower)
+
+
 class Operators(Enum):
     """An enumeration of operators."""
 
@@ -375,6 +462,92 @@ class Operators(Enum):
                     pass
             return super().value
 
+    @classmethod
+    def resolve(cls, suffix: str) -> "Operators | None":
+        """Get the operator for a query suffix, case-insensitively.
+
+        Example:
+        ```
+        >>> Operators.resolve("iexact")
+        <Operators.IEXACT: ...>
+        >>> Operators.resolve("c") is None
+        True
+        ```
+
+        Args:
+            suffix: The last part of a query path, e.g. `gt` in `a__gt`.
+
+        Returns:
+            The matching operator, or `None` if the suffix doesn't name one.
+        """
+        return _OPERATORS_BY_SUFFIX.get(suffix.lower())
+
+    def validate_rhs(self, rhs: object) -> None:
+        """Validate the right-hand side once, ahead of evaluating many values.
+
+        Args:
+            rhs: The value to compare against
+
+        Raises:
+            TypeError: If a string operator is given a right-hand side that isn't a str.
+        """
+        if self in _STRING_OPERATORS and not isinstance(rhs, str):
+            msg = f"{self} requires a str to compare against, got {type(rhs).__name__}"
+            raise TypeError(msg)
+
+    def bind(self, rhs: object) -> Callable[[Any], bool]:  # pyright: ignore[reportExplicitAny]
+        """Bind the right-hand side, returning a predicate over values.
+
+        Work that depends only on `rhs` is done here once instead of per value, e.g.
+        case-insensitive operators lower `rhs` up front, comparisons coerce `rhs` once
+        and call the C-level `operator` function, `RANGE` unpacks its bounds and `IN`
+        builds a set of its candidates.
+
+        Example:
+        ```
+        >>> matches = Operators.ICONTAINS.bind(", WO")
+        >>> matches("hello, world")
+        True
+        ```
+
+        Args:
+            rhs: The value to compare against
+
+        Returns:
+            A callable taking the value to compare [left-hand side].
+
+        Raises:
+            TypeError: If a string operator is given a right-hand side that isn't a str.
+        """
+        self.validate_rhs(rhs)
+        lowered = _LOWERED.get(self)
+        if lowered is not None:
+            return partial(_match_str, lowered, cast("str", rhs).lower())
+        checked = _LENGTH_CHECKED.get(self)
+        if checked is not None:
+            rhs_str = cast("str", rhs)
+            if len(rhs_str) == 1:
+                checked = _SINGLE_CHAR.get(self, checked)
+            return partial(_match_str, checked, rhs_str)
+        compare = _RAW_OPS.get(self)
+        if compare is not None:
+            rhs_lex = decimal_or_string(rhs)  # pyright: ignore[reportArgumentType]
+            if type(rhs) in NUMERIC_TYPES:
+                return partial(_compare_numeric, compare, rhs, rhs_lex)
+            return partial(_compare_lex, compare, rhs_lex)
+        if self is Operators.RANGE:
+            lower, upper = cast("tuple[R, R]", rhs)
+            return partial(_between, lower, upper)
+        if self is Operators.IN and (in_set := _bind_in_set(rhs)) is not None:
+            return in_set
+
+        func = self._value_
+
+        def predicate(value: Any) -> bool:  # pyright: ignore[reportExplicitAny, reportAny]
+            return func(value, rhs)
+
+        return predicate
+
     # TODO: Typing is probably not totally correct here
     def evaluate(self, value: _T, rhs: _T) -> bool:
         """Evaluate the operator.
@@ -385,5 +558,57 @@ class Operators(Enum):
 
         Returns:
             bool: The result of the comparison
+
+        Raises:
+            TypeError: If a string operator is given a value that isn't a str.
         """
-        return self.value(value, rhs)
+        if self in _STRING_OPERATORS:
+            _require_str(value)
+        # `_value_` skips the `value` property and its deprecation checks
+        return self._value_(value, rhs)
+
+
+# Built from `__members__` so the deprecated aliases resolve too
+_OPERATORS_BY_SUFFIX: dict[str, Operators] = {
+    name.lower(): op for name, op in Operators.__members__.items()
+}
+
+_STRING_OPERATORS = frozenset(
+    {
+        Operators.IEXACT,
+        Operators.CONTAINS,
+        Operators.ICONTAINS,
+        Operators.STARTSWITH,
+        Operators.ISTARTSWITH,
+        Operators.ENDSWITH,
+        Operators.IENDSWITH,
+    }
+)
+
+_LOWERED: dict[Operators, Callable[[str, str], bool]] = {
+    Operators.IEXACT: _iequal_lowered,
+    Operators.ICONTAINS: _icontains_lowered,
+    Operators.ISTARTSWITH: _istartswith_lowered,
+    Operators.IENDSWITH: _iendswith_lowered,
+}
+
+_LENGTH_CHECKED: dict[Operators, Callable[[str, str], bool]] = {
+    Operators.CONTAINS: _contains_checked,
+    Operators.STARTSWITH: _startswith_checked,
+    Operators.ENDSWITH: _endswith_checked,
+}
+
+_SINGLE_CHAR: dict[Operators, Callable[[str, str], bool]] = {
+    Operators.STARTSWITH: _startswith_char,
+    Operators.ENDSWITH: _endswith_char,
+}
+
+# Plain comparisons behind the `validate_call_lex` operators; `bind` coerces `rhs` once
+_RAW_OPS: dict[Operators, Callable[[object, object], bool]] = {
+    Operators.EXACT: operator.eq,
+    Operators.NE: operator.ne,
+    Operators.GT: operator.gt,
+    Operators.GTE: operator.ge,
+    Operators.LT: operator.lt,
+    Operators.LTE: operator.le,
+}
@@ -2,6 +2,7 @@
 
 Functions:
     - path_as_parts: Convert a path string to a list of parts.
+    - split_path: Split a path string into a cached tuple of parts.
     - get_path_part: Get a part of a path string.
     - path_popleft: Remove the first part of a path string.
     - path_popright: Remove the last part of a path string.
@@ -23,6 +24,29 @@ else:  # pragma: no cover
     from typing_extensions import override
 
 
+@functools.lru_cache(maxsize=4096)
+def split_path(path: str, separator: str = "__") -> tuple[str, ...]:
+    """Split a path string into a tuple of parts, memoizing the result.
+
+    Paths are typically drawn from a small vocabulary of filter kwargs, so the
+    same strings are split over and over; caching makes repeat lookups a single
+    dict hit. Parts are interned so `getattr` can match attribute names by identity.
+
+    Args:
+      path: The path string.
+      separator: The separator to use.
+
+    Returns:
+        A tuple of parts.
+
+    Examples:
+        >>> split_path("a__b__c")
+        ("a", "b", "c")
+
+    """
+    return tuple(sys.intern(part) for part in path.split(separator))
+
+
 def path_as_parts(path: str, *, separator: str = "__") -> deque[str]:
     """Convert a path string to a list of parts.
 
@@ -38,13 +62,16 @@ def path_as_parts(path: str, *, separator: str = "__") -> deque[str]:
         ["a", "b", "c"]
 
     """
-    return deque(path.split(separator))
+    return deque(split_path(path, separator))
 
 
-LEX_TYPES_PRIORITY = [Decimal, int, float, str]
+LEX_TYPES_PRIORITY = [int, float, Decimal, str]
 
 LexType = Decimal | int | float | str
 
+# Same-type pairs of these already compare the way their Decimal coercions would
+NUMERIC_TYPES = frozenset({int, float})
+
 
 def coerce_to_decimal(value: LexType) -> Decimal:
     """Coerce a value to a Decimal.
@@ -58,6 +85,11 @@ def coerce_to_decimal(value: LexType) -> Decimal:
     Raises:
         ValueError: If the value cannot be coerced.
     """
+    value_type = type(value)
+    if value_type is int:  # exact check, so bools still go through `str`
+        return Decimal(value)
+    if value_type is float:  # via `repr`, so 0.1 is Decimal("0.1"), not its binary
+        return Decimal(repr(value))
     if isinstance(value, Decimal):
         return value
     try:
@@ -99,12 +131,21 @@ def validate_call_lex(
         func: The function to validate
 
     Returns:
-        Callable: The validated function
+        Callable: The validated function. An already validated function is returned
+            as is.
     """
-
-    @functools.wraps(func)
-    def wrapper(*args):
-        args = (decimal_or_string(arg) for arg in args)
-        return func(*args)
-
+    if getattr(func, "_lex_validated", False):
+        return func
+
+    def wrapper(value: ValueT, rhs: RHS_T) -> T:
+        if type(value) is type(rhs) and type(value) in NUMERIC_TYPES:
+            return func(value, rhs)
+        return func(decimal_or_string(value), decimal_or_string(rhs))  # pyright: ignore[reportArgumentType]
+
+    # Copied by hand rather than `functools.wraps`, so no `__wrapped__` layer is added
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper._lex_validated = True  # pyright: ignore[reportFunctionMemberAccess]
     return wrapper
@@ -1,9 +1,9 @@
-from collections import deque
+import re
 from contextlib import nullcontext
 from typing import Any
 
 import pytest
-from polyfactory.factories.pydantic_factory import ModelFactory
+from polyfactory.factories import DataclassFactory
 
 from attrmagic import core
 from attrmagic.sentinels import MISSING
@@ -82,7 +82,7 @@ def test_setattr_path_nested():
     assert bar_child.b == 43
 
 
-class AttrPathFactory(ModelFactory[core.AttrPath]):
+class AttrPathFactory(DataclassFactory[core.AttrPath]):
     separator = "__"
     value = "a__b__c"
 
@@ -93,7 +93,7 @@ def test_attr_path_creation():
     assert isinstance(attr_path.value, str)
     assert attr_path.value == "a__b__c"
     assert attr_path.depth == 3
-    assert attr_path.parts == deque(["a", "b", "c"])
+    assert attr_path.parts == ("a", "b", "c")
     first = attr_path.popleft()
     assert first == "a"
     assert attr_path.render() == "b__c"
@@ -108,6 +108,8 @@ def test_pop():
     attr_path = AttrPathFactory.build()
     assert attr_path.pop(1) == "b"
     assert attr_path.render() == "a__c"
+    assert attr_path.pop(-2) == "a"
+    assert attr_path.parts == ("c",)
 
 
 def test_attr_str_to_path():
@@ -118,7 +120,7 @@ def test_attr_str_to_path():
     assert isinstance(attr_path.value, str)
     assert attr_path.value == path_str
     assert attr_path.depth == 3
-    assert attr_path.parts == deque(["a", "b", "c"])
+    assert attr_path.parts == ("a", "b", "c")
 
 
 def test_attr_from_parts():
@@ -155,3 +157,65 @@ def test_query_path_iexact():
     assert query_path.operator == core.Operators.IEXACT
     assert query_path._separator == "__"
     assert query_path.attr_path.separator == "__"
+
+
+def test_query_path_underscore():
+    query_path = core.QueryPath.from_string("a___gt")
+    assert query_path.attr_path.parts == ("a", "_gt")
+    assert query_path.operator == core.Operators.EXACT
+    query_path = core.QueryPath.from_string("a_b__gt")
+    assert query_path.attr_path.parts == ("a_b",)
+    assert query_path.operator == core.Operators.GT
+
+
+def test_setattr_getattr_underscore_round_trip():
+    inner = Bar(b=None)
+    inner._b = 1
+    foo = Bar(b=None)
+    foo.a = inner
+    core.setattr_path(foo, "a___b", 99)
+    assert inner._b == 99
+    assert core.getattr_path(foo, "a___b") == 99
+
+
+def test_query_path_compile():
+    matches = core.QueryPath.from_string("b__b__startswith").compile("he")
+    assert matches(Bar(b=Bar(b="hello")))
+    assert not matches(Bar(b=Bar(b="world")))
+    assert not core.QueryPath.from_string("b__b").compile(1)(Bar(b=None))
+    assert core.QueryPath.from_string("gt").compile(1)(2)
+    with pytest.raises(TypeError, match="requires a str"):
+        core.QueryPath.from_string("name__icontains").compile(1)
+
+
+def test_query_path_follow():
+    query_path = core.QueryPath.from_string("b__b__gt")
+    assert query_path.parts == ("b", "b")
+    assert core.QueryPath.from_string("gt").parts == ()
+    assert query_path.follow(lambda value: value == 42)(Bar(b=Bar(b=42)))
+
+
+def test_path_getter():
+    foo = Bar(b=Bar(b=42))
+    assert core.path_getter(("b", "b"))(foo) == 42
+    assert core.path_getter(())(foo) is foo
+    with pytest.raises(AttributeError):
+        core.path_getter(("b", "a"))(foo)
+
+
+def test_getattr_nested_none():
+    foo = Bar(b=None)
+    assert core.getattr_path(foo, "b__b") is None
+    assert core.getattr_path(foo, "b__b", default=43) is None
+
+
+def test_getattr_path_parsed():
+    bar = Bar(b=None)
+    foo = Bar(b=bar)
+    assert core.getattr_path_parsed(foo, ("b",)) is bar
+    assert core.getattr_path_parsed(foo, ("b", "b", "b")) is None
+    assert core.getattr_path_parsed(foo, ("c",), default=None) is None
+    with pytest.raises(AttributeError, match="'c__d'"):
+        core.getattr_path_parsed(foo, ("c", "d"))
+    with pytest.raises(AttributeError, match=re.escape("'c.d'")):
+        core.getattr_path_parsed(foo, ("c", "d"), separator=".")
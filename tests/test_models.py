@@ -2,7 +2,7 @@ import enum
 
 import pytest
 
-from attrmagic.models import ClassBase, SearchBase, SimpleDict
+from attrmagic.models import ClassBase, SearchBase, SimpleDict, SimpleListRoot
 
 
 class Bar(ClassBase):
@@ -45,6 +45,65 @@ def test_searchbase_filter(bar_search: BarSearch):
     assert filtered[1].c == 3
 
 
+def test_searchbase_filter_nested():
+    foo_search = SearchBase[Foo]([Foo(a=Bar(c=1)), Foo(a=Bar(c=2))])
+    filtered = foo_search.filter(a__c__gte=2)
+    assert len(filtered) == 1
+    assert filtered[0].a.c == 2
+
+
+def test_searchbase_filter_none_in_path():
+    class Baz(ClassBase):
+        a: Bar | None = None
+
+    baz_search = SearchBase[Baz]([Baz(), Baz(a=Bar(c=2))])
+    filtered = baz_search.filter(a__c=2)
+    assert len(filtered) == 1
+    assert filtered[0].a == Bar(c=2)
+
+
+def test_searchbase_filter_many_kwargs():
+    class Baz(ClassBase):
+        a: Bar | None = None
+        b: int = 0
+
+    baz_search = SearchBase[Baz]([Baz(b=2), Baz(a=Bar(c=2), b=1), Baz(a=Bar(c=2), b=2)])
+    assert baz_search.get(a__c=2, b=1).b == 1
+    filtered = baz_search.filter(a__c=2, b__gt=1)
+    assert len(filtered) == 1
+    assert filtered[0].a == Bar(c=2)
+
+
+def test_simplelistroot_filter_items():
+    filtered = SimpleListRoot[int](root=[1, 2, 3]).filter(gt=1)
+    assert list(filtered) == [2, 3]
+
+
+def test_searchbase_filter_invalid_rhs(bar_search: BarSearch):
+    with pytest.raises(TypeError):
+        bar_search.filter(c__startswith=1)
+
+
+@pytest.mark.parametrize("kwargs", [{"zz": 1}, {"c": 1, "zz": 1}])
+def test_searchbase_filter_missing_attribute(bar_search: BarSearch, kwargs):
+    with pytest.raises(AttributeError, match="has no attribute path 'zz'"):
+        bar_search.filter(**kwargs)
+
+
+def test_searchbase_filter_none_string_value():
+    class Baz(ClassBase):
+        name: str | None = None
+
+    baz_search = SearchBase[Baz]([Baz(name="hello"), Baz()])
+    with pytest.raises(TypeError, match="require a str"):
+        baz_search.filter(name__istartswith="he")
+
+
+def test_searchbase_filter_many(bar_search: BarSearch):
+    filtered = bar_search.filter_many({"c__gt": 1}, {"c__gt": 2})
+    assert list(filtered) == [Bar(c=3)]
+
+
 def test_searchbase_exclude(bar_search: BarSearch):
     excluded = bar_search.exclude(c__gt=1)
     assert len(excluded) == 1
@@ -105,6 +164,13 @@ def test_searchbase_get(bar_search: BarSearch):
     assert bar_search.get(c__exact=4, default=None) is None
 
 
+def test_searchbase_get_many(bar_search: BarSearch):
+    with pytest.raises(ValueError, match="more than one"):
+        bar_search.get(c__gt=1)
+    assert bar_search.get(c__gt=1, default=None) is None
+    assert len(bar_search) == 3
+
+
 def test_repr(bar_search):
     assert repr(bar_search) == "SearchBase[Bar]([Bar(c=1), Bar(c=2), Bar(c=3)])"
 
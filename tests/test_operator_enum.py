@@ -1,5 +1,86 @@
+import pytest
+
 from attrmagic.operators import Operators
 
 
 def test_evaluate():
     assert Operators.IEXACT.evaluate("hElLo", "hello")
+
+
+def test_validate_rhs():
+    Operators.GT.validate_rhs(1)
+    Operators.ICONTAINS.validate_rhs("hello")
+    with pytest.raises(TypeError):
+        Operators.ICONTAINS.validate_rhs(1)
+
+
+@pytest.mark.parametrize("operator", [Operators.IEXACT, Operators.STARTSWITH])
+@pytest.mark.parametrize("rhs", [None, 1])
+def test_bind_invalid_rhs(operator: Operators, rhs):
+    with pytest.raises(TypeError, match="requires a str"):
+        operator.bind(rhs)
+
+
+@pytest.mark.parametrize(
+    ("operator", "rhs", "value", "expected"),
+    [
+        (Operators.IEXACT, "HeLLo", "hello", True),
+        (Operators.ICONTAINS, ", WO", "hello, world", True),
+        (Operators.ISTARTSWITH, "HELL", "hello", True),
+        (Operators.IENDSWITH, "LO", "hello", True),
+        (Operators.IENDSWITH, "he", "hello", False),
+        (Operators.IENDSWITH, "", "hello", True),
+        (Operators.IENDSWITH, "XHELLO", "hello", False),
+        (Operators.ISTARTSWITH, "HELLO!", "hello", False),
+        (Operators.ISTARTSWITH, "ÉT", "été", True),
+        (Operators.CONTAINS, "ell", "hello", True),
+        (Operators.STARTSWITH, "hello!", "hello", False),
+        (Operators.ENDSWITH, "lo", "hello", True),
+        (Operators.STARTSWITH, "h", "hello", True),
+        (Operators.STARTSWITH, "h", "", False),
+        (Operators.ENDSWITH, "o", "hello", True),
+        (Operators.ENDSWITH, "h", "hello", False),
+        (Operators.GT, 1, 2, True),
+        (Operators.GT, 1, "2", True),
+        (Operators.LT, 1.5, 0.5, True),
+        (Operators.LTE, "1.5", 1.5, True),
+        (Operators.NE, "a", "b", True),
+        (Operators.EXACT, "42", 42, True),
+        (Operators.RANGE, (1, 3), 3, True),
+        (Operators.RANGE, (1, 3), 4, False),
+        (Operators.IN, [1, 2, 3], 2, True),
+        (Operators.IN, [1, 2, 3], [2], False),
+        (Operators.IN, [[1], [2]], [2], True),
+        (Operators.IN, "hello", "ell", True),
+    ],
+)
+def test_bind(operator: Operators, rhs, value, expected):
+    assert operator.bind(rhs)(value) is expected
+
+
+def test_resolve():
+    assert Operators.resolve("gt") is Operators.GT
+    assert Operators.resolve("IEXACT") is Operators.IEXACT
+    assert Operators.resolve("equal") is Operators.EXACT
+    assert Operators.resolve("c") is None
+
+
+@pytest.mark.parametrize(
+    "operator",
+    [
+        Operators.IEXACT,
+        Operators.CONTAINS,
+        Operators.ICONTAINS,
+        Operators.STARTSWITH,
+        Operators.ISTARTSWITH,
+        Operators.ENDSWITH,
+        Operators.IENDSWITH,
+    ],
+)
+@pytest.mark.parametrize("rhs", ["h", "hello"])
+@pytest.mark.parametrize("value", [None, 1, ["hello"]])
+def test_string_operator_non_str_value(operator: Operators, rhs: str, value):
+    with pytest.raises(TypeError, match="require a str"):
+        operator.bind(rhs)(value)
+    with pytest.raises(TypeError, match="require a str"):
+        operator.evaluate(value, rhs)
@@ -28,7 +28,36 @@ def test_coerce_to_dec(value, expected):
         ("42", Decimal("42")),
         ("42.3", Decimal("42.3")),
         ("hello", "hello"),
+        (True, "True"),
+        ([1], "[1]"),
     ],
 )
 def test_decimal_or_string(value, expected):
     assert utils.decimal_or_string(value) == expected
+
+
+def test_split_path():
+    assert utils.split_path("a__b__c") == ("a", "b", "c")
+    assert utils.split_path("a.b", ".") == ("a", "b")
+    assert utils.split_path("a__b__c") is utils.split_path("a__b__c")
+
+
+def test_decimal_or_string_equal_inputs():
+    assert str(utils.decimal_or_string(Decimal(1))) == "1"
+    assert str(utils.decimal_or_string(Decimal("1.00"))) == "1.00"
+    assert str(utils.decimal_or_string(0.0)) == "0.0"
+    assert str(utils.decimal_or_string(-0.0)) == "-0.0"
+    assert utils.decimal_or_string(1) == Decimal(1)
+    assert utils.decimal_or_string(True) == "True"
+
+
+def test_validate_call_lex():
+    @utils.validate_call_lex
+    def equals(value, rhs):
+        """Docstring."""
+        return value == rhs
+
+    assert equals(42, "42")
+    assert equals.__name__ == "equals"
+    assert equals.__doc__ == "Docstring."
+    assert utils.validate_call_lex(equals) is equals